@@ -2,11 +2,12 @@
 Module to do MIG filename parsing and regex matching
 """
 
-import glob
+import os
 import re
 from typing import Optional, Iterator
 
 NPS_PATTERN = '(?P<path>(?:.*\/)?(?P<filename>(?P<sender>[0-9]{13})\.(?P<receiver>[0-9]{13})\.(?P<sequence>[0-9]*)\.(?P<export>EXPORT(?P<export_no>[0-9]{2})[^\.]*)\.(?P<mig>MIG[^\.]*)\.csv))'
+_NPS_RE = re.compile(NPS_PATTERN, flags=re.I)
 
 def match_filename(filename: str) -> Optional[dict]:
     """
@@ -22,7 +23,7 @@ def match_filename(filename: str) -> Optional[dict]:
         A dict with the full file path, filename, and components
         If no match is found, None is returned
     """
-    r = re.match(string=filename, pattern=NPS_PATTERN, flags=re.I)
+    r = _NPS_RE.match(filename)
     if r:
         return r.groupdict()
     else:
@@ -42,7 +43,17 @@ def find_files(pathname: str) -> Iterator[dict]:
     -------
     dict
     """
-    for filename in glob.iglob(f'{pathname}/*'):
-        r = match_filename(filename=filename)
-        if r:
-            yield r
\ No newline at end of file
+    with os.scandir(pathname) as it:
+        for entry in it:
+            # cheap checks first, so the regex only runs on likely candidates
+            name = entry.name
+            if not (name[:1].isdigit() and name.lower().endswith('.csv')):
+                continue
+            if not entry.is_file():
+                continue
+            # match on the bare name, so the regex doesn't have to walk the
+            # directory part of every path
+            r = match_filename(filename=name)
+            if r:
+                r['path'] = entry.path
+                yield r
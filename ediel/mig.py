@@ -1,10 +1,11 @@
-import functools
+import io
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Type, Iterator
+from typing import List, Dict, Type
 import re
 
-from .uniformat import UNIBaseParser
+from .uniformat import UNIBaseParser, ParserError
 from .misc import open_filename
 from .filename import match_filename
 
@@ -18,38 +19,31 @@ def get_mig_parser_cls(filepath: str) -> Type['MigParser']:
     if not r:
         raise ValueError(f'Not a valid MIG file: {filepath}')
 
-    parsers = {
-        '91': Mig3Export91Parser,
-        '92': Mig3Export92Parser,
-        '93': Mig3Export93Parser,
-        '94': Mig3Export94Parser,
-        '95': Mig3Export95Parser,
-        '96': Mig3Export96Parser
-    }
-    parser = parsers[r['export_no']]
-    return parser
+    return _PARSERS[r['export_no']]
 
 class MigParser(UNIBaseParser):
     date_columns: List[int]  = NotImplemented
     column_names: Dict = NotImplemented
 
     def _parse_dataframe(self) -> pd.DataFrame:
-        with open_filename(filename=self.strio, mode='r') as f:
+        with open_filename(filename=self._body_io, mode='r') as f:
             df = pd.read_csv(
                 filepath_or_buffer=f,
                 sep=';',
                 header=None,
-                engine='python',
-                skiprows=self.body_start_line,
-                parse_dates=self.date_columns,
-                date_parser=self._date_parser,
+                engine='c',
+                dtype={col: str for col in self.date_columns},
                 decimal=',',
-                skipfooter=len(self.raw) - self.body_end_line - 1,
-                on_bad_lines='skip'
+                on_bad_lines='skip',
+                low_memory=False
             )
+        for col in self.date_columns:
+            df[col] = self._parse_dates(df[col])
         df.rename(columns=self.column_names, inplace=True)
         if 'Description' in df.columns:
-            df['Description'] = df['Description'].str.strip(' ')
+            # only the few distinct descriptions are stripped
+            descriptions = df['Description'].dropna().unique()
+            df['Description'] = df['Description'].map({v: v.strip(' ') for v in descriptions})
 
         df.drop_duplicates(inplace=True)
 
@@ -78,63 +72,149 @@ class Mig3Export91Parser(MigParser):
         216: 'RequestReceiverRef'
     }
 
-    @functools.lru_cache(maxsize=128, typed=False)
+    meta_columns = ['AccessEAN', 'Description', 'Serial', 'Direction',
+                    'CounterID', 'EnergyType', 'Unit']
+
+    def __init__(self, *args, **kwargs):
+        super(Mig3Export91Parser, self).__init__(*args, **kwargs)
+        # timeseries frames per index_shift, freed together with the parser
+        self._timeseries_frames = {}
+
     def get_timeseries_frame(self, index_shift: str = 'right') -> pd.DataFrame:
-        df = self.get_dataframe()
+        if index_shift not in self._timeseries_frames:
+            self._timeseries_frames[index_shift] = self._parse_timeseries_frame(
+                index_shift=index_shift)
+        return self._timeseries_frames[index_shift]
 
-        def parse_columns(frame: pd.DataFrame) -> Iterator[pd.DataFrame]:
-            for _, group in frame.groupby([
-                'AccessEAN', 'EnergyType', 'Unit', 'Serial'
-            ], dropna=False):
-                parsed_rows = (self._parse_row_to_timeseries(
-                    row,
-                    index_shift=index_shift)
-                for _, row in group.iterrows())
-                parsed_rows = [row for row in parsed_rows if not row.empty]
-                if len(parsed_rows) == 0:
-                    continue
-                column = pd.concat(parsed_rows)
-                yield column
-        columns = parse_columns(frame=df)
-        df_t = pd.concat(columns, axis=1)
-        return df_t
+    def _parse_timeseries_frame(self, index_shift: str = 'right') -> pd.DataFrame:
+        df = self.get_dataframe()
 
-    @staticmethod
-    def _parse_row_to_timeseries(
-            row: pd.Series, index_shift: str = "right") -> pd.DataFrame:
-        interval = row['Interval']
-        if pd.isna(interval):
+        # visit the rows in the order of a groupby on the meter keys, but
+        # sort on integer codes instead
+        codes = []
+        for key in ['AccessEAN', 'EnergyType', 'Unit', 'Serial']:
+            key_codes, uniques = pd.factorize(df[key], sort=True)
+            # like groupby with dropna=False, missing keys come last
+            key_codes[key_codes == -1] = len(uniques)
+            codes.append(key_codes)
+        order = np.lexsort(codes[::-1])
+
+        # rows without an interval hold no timeseries
+        order = order[df['Interval'].notna().to_numpy()[order]]
+        if len(order) == 0:
             return pd.DataFrame()
-        index = pd.date_range(start=row.Start, end=row.End,
-                              freq=f'{interval}min', inclusive=index_shift)
-        step = int(5 - (60 / interval))
-        start_slice = 9 + step - 1
 
-        values = pd.Series(data=row[start_slice:start_slice + len(index) * step:step].values, index=index)
-        meta_v = (
-            row['AccessEAN'], row['Description'], row['Serial'],
-            row['Direction'], row['CounterID'], row['EnergyType'],
-            row['Unit'], 'value')
+        intervals = df['Interval'].to_numpy(dtype=float)[order]
+        bounds = list(zip(df['Start'].iloc[order], df['End'].iloc[order]))
+        metas = df[self.meta_columns].to_numpy()[order]
 
-        quality_codes = pd.Series(data=row[start_slice + 100:start_slice + 100 + len(index) * step: step].values,
-                                  index=index)
-        meta_q = (
-            row['AccessEAN'], row['Description'], row['Serial'],
-            row['Direction'], row['CounterID'], row['EnergyType'],
-            row['Unit'], 'quality')
-
-        meta_names = ['AccessEAN', 'Description', 'Serial', 'Direction',
-                      'CounterID','EnergyType', 'Unit', None]
+        # the 100 value and the 100 quality columns are taken as typed blocks,
+        # so the values never pass through python objects
+        values = df.iloc[:, 9:109].to_numpy(dtype=float)[order]
+        quality_frame = df.iloc[:, 109:209]
+        quality_codes = quality_frame.to_numpy()[order]
 
         # if the quality code equals "?", we want the value to result in NaN
-        # by multiplying it with float('NaN')
-        # if the quality code is anything else, we retain it by multiplying it with 1
-        quality_multiplier = quality_codes.map(lambda x: float('NaN') if x == '?' else 1)
-        values = values * quality_multiplier
+        # compared on the frame, so string columns backed by pyarrow use its
+        # kernels instead of comparing python objects
+        values[quality_frame.eq('?').to_numpy(dtype=bool)[order]] = np.nan
+
+        # rows with the same interval share their layout, so they are
+        # parsed together as one block
+        parsed_rows = [None] * len(order)
+        for interval in np.unique(intervals):
+            block = np.flatnonzero(intervals == interval)
+            parsed_block = self._parse_rows_to_timeseries(
+                bounds=[bounds[i] for i in block],
+                values=values[block],
+                quality_codes=quality_codes[block],
+                interval=interval,
+                index_shift=index_shift)
+            for i, parsed in zip(block, parsed_block):
+                parsed_rows[i] = (tuple(metas[i]),) + parsed
+
+        # rows with the same metadata end up in the same pair of columns
+        positions = {}
+        for meta, _, _, _ in parsed_rows:
+            positions.setdefault(meta, len(positions))
+
+        # one sorted index for all rows, instead of aligning every row and
+        # every group with pd.concat
+        # the rows are taken as UTC nanoseconds, whatever the resolution
+        # pandas parsed Start and End at
+        index = np.unique(np.concatenate([
+            idx.to_numpy(dtype='datetime64[ns]') for _, idx, _, _ in parsed_rows]))
+        values = np.full((len(index), len(positions)), np.nan)
+        quality_codes = np.full((len(index), len(positions)), np.nan, dtype=object)
+        filled = np.zeros((len(index), len(positions)), dtype=bool)
+        # rows covering the same period at the same interval share their
+        # offsets into the output, so these are looked up only once
+        offsets = {}
+        for (meta, idx, vals, qcs), (start, end), interval in zip(parsed_rows, bounds, intervals):
+            if (start, end, interval) not in offsets:
+                offsets[(start, end, interval)] = np.searchsorted(
+                    index, idx.to_numpy(dtype='datetime64[ns]'))
+            idx_rows = offsets[(start, end, interval)]
+            # rows of the same meter share a column, so overlapping periods
+            # would overwrite each other
+            if filled[idx_rows, positions[meta]].any():
+                raise ParserError(f'Overlapping periods for the same meter: {meta}')
+            filled[idx_rows, positions[meta]] = True
+            values[idx_rows, positions[meta]] = vals
+            quality_codes[idx_rows, positions[meta]] = qcs
+
+        data = {}
+        for meta, pos in positions.items():
+            data[meta + ('value',)] = values[:, pos]
+            data[meta + ('quality',)] = quality_codes[:, pos]
+        tz = parsed_rows[0][1].tz
+        index = pd.DatetimeIndex(index).tz_localize('UTC').tz_convert(tz)
+        df_t = pd.DataFrame(data, index=index)
+        df_t.columns.names = self.meta_columns + [None]
+        return df_t
+
+    @staticmethod
+    def _parse_rows_to_timeseries(
+            bounds: List[tuple], values: np.ndarray, quality_codes: np.ndarray,
+            interval: float, index_shift: str = "right") -> List[tuple]:
+        """
+        Parameters
+        ----------
+        bounds : [(pd.Timestamp, pd.Timestamp)]
+            Start and End of every row that shares this interval
+        values : np.ndarray
+            2D array with the 100 value columns of those rows
+        quality_codes : np.ndarray
+            2D array with the 100 quality columns of those rows
+        interval : float
+            interval in minutes
+        index_shift : str
+
+        Returns
+        -------
+        list((pd.DatetimeIndex, np.ndarray, np.ndarray))
+            the index, values and quality codes of every row
+        """
+        # most rows in a file cover the same period, so build every distinct
+        # index only once
+        freq = pd.tseries.frequencies.to_offset(f'{interval}min')
+        date_ranges = {}
+        indices = []
+        for start, end in bounds:
+            if (start, end) not in date_ranges:
+                date_ranges[(start, end)] = pd.date_range(
+                    start=start, end=end, freq=freq, inclusive=index_shift)
+            indices.append(date_ranges[(start, end)])
+
+        # longer intervals only use every step-th column
+        step = int(5 - (60 / interval))
+        values = values[:, step - 1::step]
+        quality_codes = quality_codes[:, step - 1::step]
 
-        ts = pd.concat([values, quality_codes], axis=1)
-        ts.columns = pd.MultiIndex.from_tuples([meta_v, meta_q], names=meta_names)
-        return ts
+        return [
+            (index, vals[:len(index)], qcs[:len(index)])
+            for index, vals, qcs in zip(indices, values, quality_codes)
+        ]
 
 
 class Mig3Export92Parser(Mig3Export91Parser):
@@ -193,62 +273,72 @@ class Mig3Export94Parser(MigParser):
         'Blank2'
     ]
 
+    # rows that concern a calculated register rather than a physical one
+    calculated_row_pattern = re.compile(r'[0-9]{18};AP LEVEL;')
+
     num_cols = ['Value', 'Estimate', 'PreviousValue', 'LatestValue', 'GasConversionFactor']
     datetime_cols = ['Start', 'End', 'EstimateStart', 'PreviousDateTime', 'LatestDateTime']
 
     def _parse_dataframe(self) -> pd.DataFrame:
-        with open_filename(filename=self.file, mode='r') as f:
-            df = pd.read_csv(
-                filepath_or_buffer=f,
-                engine='python',
-                header=None,
-                skiprows=self.body_start_line,
-                skipfooter=len(self.raw) - self.body_end_line - 1,
-                sep="|",
-                names=['row']
-            )
-
-        df['calculated'] = df.row.apply(self._is_calculated_row)
+        body = pd.Series(self.lines[self.body_start_line:self.body_end_line + 1])
+        body = body[body != ''].reset_index(drop=True)
 
-        df_calculated = df[df['calculated']].copy()
-        df_physical = df[~df['calculated']].copy()
+        calculated = body.str.match(self.calculated_row_pattern, na=False)
 
-        df_calculated[self.calculated_columns] = df_calculated['row'].str.split(';', n=18, expand=True)
-        df_physical[self.phyisical_columns] = df_physical['row'].str.split(';', n=21, expand=True)
+        # both kinds of rows have their own layout, so each subset is
+        # tokenized separately by the csv engine
+        df_calculated = self._read_rows(lines=body[calculated], names=self.calculated_columns)
+        df_calculated.insert(0, 'calculated', True)
+        df_physical = self._read_rows(lines=body[~calculated], names=self.phyisical_columns)
+        df_physical.insert(0, 'calculated', False)
 
         df = pd.concat([df_calculated, df_physical], sort=False)
-        df.drop(axis=1, columns=['row', 'Blank1', 'Blank2'], inplace=True)
-
-        df.replace('', float('NaN'), inplace=True)
-
-        for col in self.num_cols:
-            try:
-                df[col] = df[col].str.replace(',', '.')
-            except AttributeError:  # entire row empty
-                pass
-
-            df[col] = df[col].astype(float)
+        df.drop(columns=['Blank1', 'Blank2'], inplace=True)
 
         for col in self.datetime_cols:
-            df[col] = df[col].apply(self._date_parser)
+            df[col] = self._parse_dates(df[col])
 
         if 'Description' in df.columns:
-            df['Description'] = df['Description'].str.strip(' ')
+            # only the few distinct descriptions are stripped
+            descriptions = df['Description'].dropna().unique()
+            df['Description'] = df['Description'].map({v: v.strip(' ') for v in descriptions})
 
         return df
 
-    @staticmethod
-    def _is_calculated_row(row: str) -> bool:
-        """Checks if the row concerns a calculated or physical register"""
-        match = re.match(string=row, pattern="[0-9]{18};AP LEVEL;.*")
-        return match is not None
-
-    def _date_parser(self, datetime_str: str) -> pd.Timestamp:
-        """Override the date parser to deal with NaN's"""
-        if not isinstance(datetime_str, str):
-            return pd.Timestamp('NaT')
-        else:
-            return super(Mig3Export94Parser, self)._date_parser(datetime_str=datetime_str)
+    def _read_rows(self, lines: pd.Series, names: List[str]) -> pd.DataFrame:
+        """
+        Parameters
+        ----------
+        lines : pd.Series
+            body lines that share the same layout
+        names : [str]
+            column names of that layout
+
+        Returns
+        -------
+        pd.DataFrame
+            indexed like lines
+        """
+        # any fields beyond the layout go into extra blank columns that are
+        # dropped again, so they cannot shift the known columns
+        n_fields = max((line.count(';') + 1 for line in lines), default=len(names))
+        extra = [f'Blank{i}' for i in range(3, 3 + n_fields - len(names))]
+
+        df = pd.read_csv(
+            io.StringIO('\n'.join(lines)),
+            engine='c',
+            sep=';',
+            header=None,
+            names=names + extra,
+            index_col=False,
+            dtype={col: (float if col in self.num_cols else str) for col in names},
+            decimal=',',
+            keep_default_na=False,
+            na_values=['']
+        )
+        df.drop(columns=extra, inplace=True)
+        df.index = lines.index
+        return df
 
     def get_timeseries_frame(self) -> pd.DataFrame:
         raise NotImplementedError('No timeseries method implemented for MMR '
@@ -272,4 +362,15 @@ class Mig3Export95Parser(MigParser):
     }
 
 class Mig3Export96Parser(Mig3Export95Parser):
-    pass
\ No newline at end of file
+    pass
+
+
+# parser class per export number, see get_mig_parser_cls
+_PARSERS = {
+    '91': Mig3Export91Parser,
+    '92': Mig3Export92Parser,
+    '93': Mig3Export93Parser,
+    '94': Mig3Export94Parser,
+    '95': Mig3Export95Parser,
+    '96': Mig3Export96Parser
+}
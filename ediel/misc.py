@@ -1,3 +1,5 @@
+import functools
+
 import pandas as pd
 
 class open_filename(object):
@@ -48,6 +50,22 @@ def sort_mixed_list(iterable):
     res = strings + others
     return res
 
+@functools.lru_cache(maxsize=16)
+def sort_mixed_tuple(columns):
+    """
+    Cached version of sort_mixed_list, for files that share the same
+    column layout
+
+    Parameters
+    ----------
+    columns : tuple
+
+    Returns
+    -------
+    tuple
+    """
+    return tuple(sort_mixed_list(columns))
+
 def date_range(start=None, end=None, periods=None, **kwargs):
     """
     Extension of pandas date range.
@@ -1,23 +1,46 @@
-from cached_property import cached_property
+from functools import cached_property
 import pandas as pd
 from typing import Union, List, Dict, Tuple, Optional
 import io
 
 from .uniformat import UNIBaseParser
-from .misc import open_filename, sort_mixed_list, date_range
+from .misc import open_filename, sort_mixed_tuple, date_range
 
 
 def get_parser(path_or_buff: Union[str, io.StringIO, io.FileIO]) -> 'TwoWireParser':
-    pre_parser = TwoWireParser(path_or_buff)
-    if pre_parser.format == 'MMR':
-        return TwoWireMMRParser(path_or_buff)
-    elif pre_parser.format == 'AMR':
-        return TwoWireAMRParser(path_or_buff)
-    else:
-        raise ValueError(f'Unknown file format: {pre_parser.format}')
+    return TwoWireParser.from_file(path_or_buff)
 
 
 class TwoWireParser(UNIBaseParser):
+    text_columns = ['Name', 'Type', 'Tariff', 'Unit']
+
+    @classmethod
+    def from_file(cls, path_or_buff: Union[str, io.StringIO, io.FileIO]) -> 'TwoWireParser':
+        """
+        Read the file once and build the parser that matches its Format
+
+        Parameters
+        ----------
+        path_or_buff : str | io.StringIO | io.FileIO
+
+        Returns
+        -------
+        TwoWireMMRParser | TwoWireAMRParser
+
+        Raises
+        ------
+        ValueError
+        """
+        pre_parser = TwoWireParser(path_or_buff)
+        if pre_parser.format == 'MMR':
+            parser_cls = TwoWireMMRParser
+        elif pre_parser.format == 'AMR':
+            parser_cls = TwoWireAMRParser
+        else:
+            raise ValueError(f'Unknown file format: {pre_parser.format}')
+        # hand over the lines that were already read
+        return parser_cls(path_or_buff, lines=pre_parser.lines)
+
     @cached_property
     def format(self) -> str:
         _format = self.get_property(key='Format')
@@ -67,11 +90,10 @@ class TwoWireParser(UNIBaseParser):
         vals = df[df.columns[val_from:val_to]]
 
         if not allow_duplicate_names:
-            vals = vals.reset_index()
-            vals = vals.drop_duplicates(subset='Name')
-            vals = vals.set_index('Name')
+            vals = vals[~vals.index.duplicated(keep='first')]
 
-        vals = vals.T
+        # transpose the underlying array directly, no per column copies
+        vals = pd.DataFrame(vals.to_numpy().T, columns=vals.index)
         vals.dropna(inplace=True)
 
         start = df.Start.iloc[0]
@@ -103,9 +125,7 @@ class TwoWireParser(UNIBaseParser):
         meta = df[df.columns[meta_from:meta_to]]
 
         if not allow_duplicate_names:
-            meta = meta.reset_index()
-            meta = meta.drop_duplicates(subset='Name')
-            meta = meta.set_index('Name')
+            meta = meta[~meta.index.duplicated(keep='first')]
 
         return meta.T
 
@@ -122,33 +142,39 @@ class TwoWireParser(UNIBaseParser):
         raise NotImplementedError('Method needs to be implemented by subclass')
 
     def _pandas_read(self, parse_dates: List[int], column_names: Dict):
-        with open_filename(filename=self.file, mode='r') as f:
+        # columns that are known to hold text don't need type inference,
+        # the dates are converted after reading
+        dtype = {
+            col: str for col, name in column_names.items()
+            if name in self.text_columns or col in parse_dates
+        }
+        with open_filename(filename=self._body_io, mode='r') as f:
             _df = pd.read_csv(
                 f,
-                # because C parse does not support skipfooter:
-                engine='python',
+                engine='c',
                 header=None,
-                skiprows=self.body_start_line,
-                skipfooter=len(self.raw) - self.body_end_line - 1,
                 sep=";",
                 decimal=",",
                 true_values=['yes'],
                 false_values=['no'],
-                parse_dates=parse_dates,
-                date_parser=self._date_parser
+                dtype=dtype
             )
+        for col in parse_dates:
+            _df[col] = self._parse_dates(_df[col])
         _df.rename(columns=column_names, inplace=True)
         _df.set_index('Name', inplace=True)
 
-        sorted_cols = sort_mixed_list(_df.columns.tolist())
-        _df = _df[sorted_cols]
+        cols = tuple(_df.columns)
+        sorted_cols = sort_mixed_tuple(cols)
+        if sorted_cols != cols:
+            _df = _df[list(sorted_cols)]
 
         return _df
 
 
 class TwoWireMMRParser(TwoWireParser):
-    def __init__(self, file: Union[str, io.StringIO, io.FileIO]):
-        super(TwoWireMMRParser, self).__init__(file=file)
+    def __init__(self, *args, **kwargs):
+        super(TwoWireMMRParser, self).__init__(*args, **kwargs)
         self.is_long_format = False
 
     def _parse_dataframe(self):
@@ -170,6 +196,10 @@ class TwoWireMMRParser(TwoWireParser):
                     7: 'End'
                 }
             )
+            # unparseable dates become NaT, so a long format file shows up
+            # as a Start column without a single date
+            if df['Start'].isna().all():
+                raise ValueError('Not the short MMR format')
         except ValueError:
             df = self._pandas_read(
                 parse_dates=[6, 8],
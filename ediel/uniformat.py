@@ -1,8 +1,9 @@
 import csv
-from cached_property import cached_property
+import itertools
+from functools import cached_property
 import pytz
 import datetime as dt
-from typing import Union, Optional
+from typing import Union, Optional, List
 import io
 import pandas as pd
 
@@ -18,31 +19,31 @@ class ParserError(Exception):
 
 class UNIBaseParser:
     def __init__(self, file: Union[str, io.StringIO, io.FileIO],
-                 file_name: Optional[str] = None, remove_contract_info_lines: bool = False):
+                 file_name: Optional[str] = None, remove_contract_info_lines: bool = False,
+                 lines: Optional[List[str]] = None):
         """
         file can be file path, fileIO or stringIO
+        lines can hold the lines of file when it has already been read, so
+        it isn't read again
         """
         self.file = file
         self.file_name = file_name
 
-        with open_filename(filename=file, mode='r') as f:
-            raw = list(csv.reader(f, delimiter=";"))
+        if lines is None:
+            # only \r and \n end a line, like for csv.reader and pandas, where
+            # str.splitlines would also split on characters such as \x85
+            with open_filename(filename=file, mode='r') as f:
+                lines = [line.rstrip('\r\n') for line in f]
 
-        body_lines_removed = 0
         if remove_contract_info_lines:
-            new_raw = []
-            for line in raw:
-                if 'CONTRACT-INFO' in line:
-                    body_lines_removed += 1
-                    continue
-                new_raw.append(line)
-        self.raw = new_raw if remove_contract_info_lines else raw
-        self.strio = io.StringIO('\n'.join(";".join(x) for x in self.raw))
-
-        if len(self.raw) == 0:
+            lines = [line for line in lines
+                     if 'CONTRACT-INFO' not in line.split(';')]
+        self.lines = lines
+
+        if len(self.lines) == 0:
             raise EmptyFileException
 
-        self.dict = self._parse_properties(raw=self.raw)
+        self.dict = self._parse_properties(lines=self.lines)
 
         try:
             self.body_start_line = self.dict['Body Start']
@@ -99,13 +100,50 @@ class UNIBaseParser:
         date_str = ' '.join(co)
         return self._date_parser(datetime_str=date_str)
 
-    def _parse_properties(self, raw):
+    @cached_property
+    def raw(self):
+        """
+        All lines split into fields, tokenized on first access
+
+        Returns
+        -------
+        list(list(str))
+        """
+        return list(csv.reader(self.lines, delimiter=";"))
+
+    @cached_property
+    def strio(self) -> io.StringIO:
+        """
+        The (cleaned) raw lines as a file-like object, built on first access
+
+        Returns
+        -------
+        io.StringIO
+        """
+        return io.StringIO('\n'.join(self.lines))
+
+    @cached_property
+    def _body_io(self) -> io.StringIO:
+        """
+        The body lines (between Body Start and Body End), so they can be
+        handed to the C csv engine without skiprows or skipfooter
+
+        Returns
+        -------
+        io.StringIO
+        """
+        body = self.lines[self.body_start_line:self.body_end_line + 1]
+        return io.StringIO('\n'.join(body))
+
+    def _parse_properties(self, lines):
         """
         Transform raw lines into dict
+        Only the lines holding a key are split into fields, and the body
+        between Body Start and Body End is not visited at all
 
         Parameters
         ----------
-        raw : list(list(str))
+        lines : list(str)
 
         Returns
         -------
@@ -113,16 +151,23 @@ class UNIBaseParser:
         """
         d = {}
 
-        for i, line in enumerate(raw):
-            if len(line) == 0:
-                continue
-            key = line[0]
-
+        # the header runs up to Body Start, the footer is found by walking
+        # back from the end of the file to Body End
+        header_end = next((i for i, line in enumerate(lines)
+                           if line.startswith('[Body Start]')), len(lines))
+        footer_start = next((i for i in range(len(lines) - 1, header_end, -1)
+                             if lines[i].startswith('[Body End]')), len(lines))
+        header = range(min(header_end + 1, len(lines)))
+        footer = range(footer_start, len(lines))
+
+        for i in itertools.chain(header, footer):
+            line = lines[i]
             # all keys start and end with square braces
-            if not key.startswith('['):
+            if not line.startswith('['):
                 continue  # skip this line
-            else:
-                key = key.strip("[]")
+
+            fields = next(csv.reader([line], delimiter=";"))
+            key = fields[0].strip("[]")
 
             if key == "Body Start":
                 d.update({key: i + 1})
@@ -132,7 +177,7 @@ class UNIBaseParser:
                 continue
 
             # get everything after the key, but no empty strings
-            value = [elem for elem in line[1:] if elem != '']
+            value = [elem for elem in fields[1:] if elem != '']
 
             if len(value) == 1:
                 value = value[0]
@@ -149,10 +194,9 @@ class UNIBaseParser:
         -------
         pd.DataFrame
         """
-        if self.df is not None:
-            return self.df
-        else:
-            return self._parse_dataframe()
+        if self.df is None:
+            self.df = self._parse_dataframe()
+        return self.df
 
     def get_timeseries_frame(self):
         """
@@ -198,3 +242,20 @@ class UNIBaseParser:
         datetime = parsed.tz_localize(self.timezone)
 
         return datetime
+
+    def _parse_dates(self, dates: pd.Series) -> pd.Series:
+        """
+        Vectorized counterpart of _date_parser, for entire columns at once
+        Values that cannot be parsed become NaT
+
+        Parameters
+        ----------
+        dates : pd.Series
+
+        Returns
+        -------
+        pd.Series
+        """
+        # work on the DatetimeIndex, not through the Series .dt accessor
+        parsed = pd.to_datetime(dates.to_numpy(), format="%d%m%Y %H:%M", errors='coerce')
+        return pd.Series(parsed.tz_localize(self.timezone), index=dates.index, name=dates.name)
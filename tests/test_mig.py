@@ -0,0 +1,177 @@
+import io
+import unittest
+
+import pandas as pd
+
+from ediel.mig import Mig3Export91Parser, Mig3Export94Parser, Mig3Export95Parser
+from ediel.uniformat import ParserError
+
+
+def mig_file(rows):
+    lines = [
+        '[Subject];Test file;;',
+        '[Format];MIG',
+        '[Time zone];+0100',
+        '[Created on];01012020;10:00',
+        '[Body Start]'
+    ] + rows + ['[Body End]', '[Footer];end;']
+    return io.StringIO('\n'.join(lines))
+
+
+def export91_file(rows):
+    """
+    Build an export 91 file with one row per (description, value) pair,
+    or (description, value, start, end), in quarter hours that by default
+    cover 01012020 00:00 to 02012020 00:00
+    """
+    lines = []
+    for description, value, *bounds in rows:
+        start, end = bounds or ('01012020 00:00', '02012020 00:00')
+        fields = [start, end, '541400000000000000', 'SER0', 'C0', 'E18', 'OFF', 'KWH', 'R1']
+        fields += [value] * 96 + [''] * 4  # 100 value columns
+        fields += ['E'] * 96 + [''] * 4  # 100 quality columns
+        fields += ['15', description, '', '', '', '', '', '']
+        lines.append(';'.join(fields))
+    return mig_file(lines)
+
+
+# AccessEAN;Serial;RegisterID;EnergyType;TimeFrame;Start;End;QualityCode;
+# QualityReason;Unit;Reason;Value;Estimate;EstimateStart;SwitchingCategory;
+# Description;CityEAN;;
+EXPORT94_CALCULATED = ('541400000000000001;AP LEVEL;1.8.1;E17;TH;01012020 00:00;01022020 00:00;'
+                       'E;;KWH;R1;123,45;;;SC; Calculated ;541400000000000009;;')
+
+# AccessEAN;Serial;RegisterID;EnergyType;MeteringMethod;Unit;TimeFrame;
+# PreviousDateTime;PreviousValue;PreviousQualityCode;PreviousQualityReason;
+# LatestDateTime;LatestValue;LatestQualityCode;LatestQualityReason;Reason;
+# Description;MeterType;GasConversionFactor;GasConversionUnit;;
+EXPORT94_PHYSICAL = ('541400000000000002;SER1;1.8.1;E17;MMR;KWH;TH;01012020 00:00;100,5;E;NA;'
+                     '01022020 00:00;1200,25;E;;R1; Physical ;MT;1,02;M3;;')
+
+
+class TestMig3Export91Parser(unittest.TestCase):
+    def test_timeseries_index_in_file_range(self):
+        parser = Mig3Export91Parser(file=export91_file([('A', '1,5'), ('B', '2,5')]))
+        ts = parser.get_timeseries_frame()
+
+        tz = parser.timezone
+        self.assertEqual(ts.index[0], pd.Timestamp('2020-01-01 00:15', tz=tz))
+        self.assertEqual(ts.index[-1], pd.Timestamp('2020-01-02 00:00', tz=tz))
+        self.assertEqual(len(ts), 96)
+        self.assertEqual(ts.shape[1], 4)
+        self.assertTrue((ts.xs('value', axis=1, level=-1).to_numpy() > 1).all())
+
+    def test_timeseries_index_shift_left(self):
+        parser = Mig3Export91Parser(file=export91_file([('A', '1,5')]))
+        ts = parser.get_timeseries_frame(index_shift='left')
+
+        tz = parser.timezone
+        self.assertEqual(ts.index[0], pd.Timestamp('2020-01-01 00:00', tz=tz))
+        self.assertEqual(ts.index[-1], pd.Timestamp('2020-01-01 23:45', tz=tz))
+
+    def test_consecutive_periods_share_columns(self):
+        parser = Mig3Export91Parser(file=export91_file([
+            ('A', '1,5', '01012020 00:00', '02012020 00:00'),
+            ('A', '2,5', '02012020 00:00', '03012020 00:00')
+        ]))
+        ts = parser.get_timeseries_frame()
+
+        self.assertEqual(ts.shape, (192, 2))
+        self.assertEqual(ts.index[-1], pd.Timestamp('2020-01-03 00:00', tz=parser.timezone))
+        values = ts.xs('value', axis=1, level=-1).iloc[:, 0]
+        self.assertEqual(list(values.iloc[[0, 95, 96, 191]]), [1.5, 1.5, 2.5, 2.5])
+
+    def test_overlapping_periods_raise(self):
+        parser = Mig3Export91Parser(file=export91_file([
+            ('A', '1,5', '01012020 00:00', '02012020 00:00'),
+            ('A', '2,5', '01012020 12:00', '02012020 12:00')
+        ]))
+        with self.assertRaises(ParserError):
+            parser.get_timeseries_frame()
+
+
+class TestMig3Export94Parser(unittest.TestCase):
+    def test_mixed(self):
+        parser = Mig3Export94Parser(file=mig_file([EXPORT94_CALCULATED, EXPORT94_PHYSICAL]))
+        df = parser.get_dataframe()
+
+        self.assertEqual(list(df['calculated']), [True, False])
+        self.assertEqual(list(df['Serial']), ['AP LEVEL', 'SER1'])
+        self.assertEqual(list(df['Description']), ['Calculated', 'Physical'])
+        self.assertNotIn('Blank1', df.columns)
+        self.assertNotIn('Blank2', df.columns)
+
+        tz = parser.timezone
+        calculated, physical = df.iloc[0], df.iloc[1]
+        self.assertEqual(calculated['Start'], pd.Timestamp('2020-01-01 00:00', tz=tz))
+        self.assertEqual(calculated['End'], pd.Timestamp('2020-02-01 00:00', tz=tz))
+        self.assertTrue(pd.isna(calculated['MeteringMethod']))
+        self.assertEqual(physical['LatestDateTime'], pd.Timestamp('2020-02-01 00:00', tz=tz))
+        self.assertTrue(pd.isna(physical['Start']))
+
+    def test_calculated_only(self):
+        parser = Mig3Export94Parser(file=mig_file([EXPORT94_CALCULATED]))
+        df = parser.get_dataframe()
+
+        self.assertEqual(list(df['calculated']), [True])
+        self.assertEqual(df['Value'].iloc[0], 123.45)
+        self.assertEqual(df['CityEAN'].iloc[0], '541400000000000009')
+        self.assertIn('LatestValue', df.columns)
+
+    def test_physical_only(self):
+        parser = Mig3Export94Parser(file=mig_file([EXPORT94_PHYSICAL]))
+        df = parser.get_dataframe()
+
+        self.assertEqual(list(df['calculated']), [False])
+        self.assertEqual(df['LatestValue'].iloc[0], 1200.25)
+        self.assertEqual(df['MeterType'].iloc[0], 'MT')
+        self.assertIn('Value', df.columns)
+
+    def test_extra_fields(self):
+        parser = Mig3Export94Parser(file=mig_file([
+            EXPORT94_CALCULATED, EXPORT94_PHYSICAL + ';extra;fields']))
+        df = parser.get_dataframe()
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df['GasConversionUnit'].iloc[1], 'M3')
+        self.assertFalse(any(str(col).startswith('Blank') for col in df.columns))
+
+    def test_empty_and_na_fields(self):
+        parser = Mig3Export94Parser(file=mig_file([EXPORT94_CALCULATED, EXPORT94_PHYSICAL]))
+        df = parser.get_dataframe()
+
+        # empty fields are missing, a literal NA stays text
+        self.assertTrue(pd.isna(df['QualityReason'].iloc[0]))
+        self.assertTrue(pd.isna(df['Estimate'].iloc[0]))
+        self.assertEqual(df['PreviousQualityReason'].iloc[1], 'NA')
+        self.assertTrue(pd.isna(df['LatestQualityReason'].iloc[1]))
+
+    def test_decimal_comma(self):
+        parser = Mig3Export94Parser(file=mig_file([EXPORT94_CALCULATED, EXPORT94_PHYSICAL]))
+        df = parser.get_dataframe()
+
+        self.assertEqual(df['Value'].iloc[0], 123.45)
+        self.assertEqual(df['PreviousValue'].iloc[1], 100.5)
+        self.assertEqual(df['LatestValue'].iloc[1], 1200.25)
+        self.assertEqual(df['GasConversionFactor'].iloc[1], 1.02)
+
+
+class TestMig3Export95Parser(unittest.TestCase):
+    def test_unicode_line_breaks_in_description(self):
+        # str.splitlines would break these lines on \u2028, \x85 and \x0c
+        description = 'Caf\u00e9\u2028bar\x85baz\x0cqux'
+        parser = Mig3Export95Parser(file=mig_file([
+            f'01012020 00:00;02012020 00:00;541400000000000000;E17;AMR;TH;OFF;KWH;R1;1,5;E;{description}',
+            '01012020 00:00;02012020 00:00;541400000000000001;E17;AMR;TH;OFF;KWH;R1;2,5;E;Other'
+        ]))
+        self.assertEqual(parser.body_start_line, 5)
+        self.assertEqual(parser.body_end_line, 6)
+
+        df = parser.get_dataframe()
+        self.assertEqual(len(df), 2)
+        self.assertEqual(list(df['Description']), [description, 'Other'])
+        self.assertEqual(list(df['Consumption']), [1.5, 2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import io
+import unittest
+
+import pandas as pd
+
+from ediel.twowire import get_parser, TwoWireParser, TwoWireMMRParser, TwoWireAMRParser
+
+
+def twowire_file(fmt, rows):
+    lines = [
+        '[Subject];Test file;;',
+        f'[Format];{fmt}',
+        '[Time zone];+0100',
+        '[Created on];01012020;10:00',
+        '[Body Start]'
+    ] + rows + ['[Body End]', '[Footer];end;']
+    return io.StringIO('\n'.join(lines))
+
+
+def mmr_short_file():
+    # Name;Type;Tariff;Cumulative;Unit;Start;first value;End;other values
+    return twowire_file('MMR;Interval: 6 h', [
+        'A;Elec;T1;yes;kWh;01012020 00:00;1,5;02012020 00:00;2,5;3,5;4,5;5,5',
+        'B;Elec;T1;no;kWh;01012020 00:00;10,5;02012020 00:00;20,5;30,5;40,5;50,5',
+        'A;Elec;T2;yes;kWh;01012020 00:00;7;02012020 00:00;7;7;7;7',
+    ])
+
+
+def mmr_long_file():
+    # an extra Ean column up front and two trailing fields
+    return twowire_file('MMR;Interval: 6 h', [
+        '5414A;A;Elec;T1;yes;kWh;01012020 00:00;1,5;02012020 00:00;2,5;3,5;4,5;5,5;x;y',
+        '5414B;B;Elec;T1;no;kWh;01012020 00:00;10,5;02012020 00:00;20,5;30,5;40,5;50,5;x;y',
+    ])
+
+
+def amr_file():
+    # Start;End;Ean;Name;Type;Unit;97 quarter hour values
+    values = ';'.join(f'{i},5' for i in range(97))
+    return twowire_file('AMR', [
+        f'01012020 00:00;02012020 00:00;5414A;A;Elec;kWh;{values}',
+        f'01012020 00:00;02012020 00:00;5414B;B;Elec;kWh;{values}',
+    ])
+
+
+class TestTwoWireMMRParser(unittest.TestCase):
+    def test_short_format(self):
+        parser = get_parser(mmr_short_file())
+        self.assertIsInstance(parser, TwoWireMMRParser)
+
+        df = parser.get_dataframe()
+        self.assertFalse(parser.is_long_format)
+        self.assertEqual(list(df.index), ['A', 'B', 'A'])
+        self.assertEqual(list(df['Cumulative']), [True, False, True])
+        self.assertEqual(df['Start'].iloc[0], pd.Timestamp('2020-01-01 00:00', tz=parser.timezone))
+        self.assertEqual(df['End'].iloc[0], pd.Timestamp('2020-01-02 00:00', tz=parser.timezone))
+
+        ts = parser.get_timeseries_frame(allow_duplicate_names=False)
+        self.assertEqual(list(ts.columns), ['A', 'B'])
+        self.assertEqual(len(ts), 5)
+        self.assertEqual(ts.index[0], pd.Timestamp('2020-01-01 00:00', tz=parser.timezone))
+        self.assertEqual(ts.index[-1], pd.Timestamp('2020-01-02 00:00', tz=parser.timezone))
+        self.assertEqual(list(ts['A']), [1.5, 2.5, 3.5, 4.5, 5.5])
+        self.assertEqual(list(ts['B']), [10.5, 20.5, 30.5, 40.5, 50.5])
+
+        meta = parser.get_metadata_frame()
+        self.assertEqual(list(meta.index), ['Type', 'Tariff', 'Cumulative', 'Unit', 'Start', 'End'])
+        self.assertEqual(list(meta.columns), ['A', 'B', 'A'])
+        self.assertEqual(list(meta.loc['Tariff']), ['T1', 'T1', 'T2'])
+
+    def test_numeric_names_stay_text(self):
+        parser = get_parser(twowire_file('MMR;Interval: 6 h', [
+            '123;Elec;T1;yes;kWh;01012020 00:00;1;02012020 00:00;2;3;4;5',
+            '0456;Elec;T1;yes;kWh;01012020 00:00;6;02012020 00:00;7;8;9;10',
+        ]))
+
+        df = parser.get_dataframe()
+        self.assertEqual(list(df.index), ['123', '0456'])
+
+        ts = parser.get_timeseries_frame()
+        self.assertEqual(list(ts.columns), ['123', '0456'])
+        self.assertEqual(list(ts['123']), [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    def test_long_format(self):
+        parser = get_parser(mmr_long_file())
+
+        df = parser.get_dataframe()
+        self.assertTrue(parser.is_long_format)
+        self.assertEqual(list(df.index), ['A', 'B'])
+        self.assertEqual(list(df['Ean']), ['5414A', '5414B'])
+        self.assertEqual(df['Start'].iloc[0], pd.Timestamp('2020-01-01 00:00', tz=parser.timezone))
+
+        ts = parser.get_timeseries_frame(allow_duplicate_names=False)
+        self.assertEqual(list(ts.columns), ['A', 'B'])
+        self.assertEqual(len(ts), 5)
+        self.assertEqual(list(ts['A']), [1.5, 2.5, 3.5, 4.5, 5.5])
+
+        meta = parser.get_metadata_frame()
+        self.assertEqual(list(meta.index),
+                         ['Ean', 'Type', 'Tariff', 'Cumulative', 'Unit', 'Start', 'End'])
+        self.assertEqual(list(meta.columns), ['A', 'B'])
+
+
+class TestTwoWireAMRParser(unittest.TestCase):
+    def test_amr(self):
+        parser = get_parser(amr_file())
+        self.assertIsInstance(parser, TwoWireAMRParser)
+
+        df = parser.get_dataframe()
+        self.assertEqual(list(df.index), ['A', 'B'])
+        self.assertEqual(df['Start'].iloc[0], pd.Timestamp('2020-01-01 00:00', tz=parser.timezone))
+
+        ts = parser.get_timeseries_frame(allow_duplicate_names=False)
+        self.assertEqual(list(ts.columns), ['A', 'B'])
+        self.assertEqual(len(ts), 96)
+        self.assertEqual(ts.index[0], pd.Timestamp('2020-01-01 00:00', tz=parser.timezone))
+        self.assertEqual(ts.index[-1], pd.Timestamp('2020-01-01 23:45', tz=parser.timezone))
+        self.assertEqual(ts['A'].iloc[0], 0.5)
+        self.assertEqual(ts['B'].iloc[-1], 95.5)
+
+        meta = parser.get_metadata_frame()
+        self.assertEqual(list(meta.index), ['Start', 'End', 'Ean', 'Type', 'Unit'])
+        self.assertEqual(list(meta.loc['Ean']), ['5414A', '5414B'])
+
+
+class TestTwoWireParser(unittest.TestCase):
+    def test_from_file(self):
+        parser = TwoWireParser.from_file(amr_file())
+        self.assertIsInstance(parser, TwoWireAMRParser)
+        self.assertEqual(parser.format, 'AMR')
+
+        parser = TwoWireParser.from_file(mmr_short_file())
+        self.assertIsInstance(parser, TwoWireMMRParser)
+        self.assertEqual(parser.interval, '6h')
+        self.assertFalse(parser.is_long_format)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            TwoWireParser.from_file(twowire_file('XYZ', []))
+
+
+if __name__ == '__main__':
+    unittest.main()